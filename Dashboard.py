@@ -1,4 +1,3 @@
-from sklearn.utils import indices_to_mask
 import streamlit as st
 import pandas as pd 
 import requests
@@ -12,17 +11,39 @@ from _bollinger_bands import BollingerBands
 
 
 
+_TICKER_TO_CODE = {"ADH" : "9000" , "AFM" : "12200" , "AFI" : "11700" , "GAZ" : "7100" , "AGM" : "6700" , "ADI" : "11200" , "ALM" : "6600" , "ARD" : "27" , "ATL" : "10300" , "ATW" : "8200" , "ATH" : "3200" , "NEJ" : "7000" , "BAL" : "3300" , "BOA" : "1100" , "BCP" : "8000" , "BCI" : "5100" , "CRS" : "8900" , "CDM" : "3600" , "CDA" : "3900" , "CIH" : "3100" , "CMA" : "4000" , "CMT" : "11000" , "COL" : "9200" , "CSR" : "4100" , "CTM" : "2200" , "DRI" : "8500" , "DLM" : "10800" , "DHO" : "10900" , "DIS" : "4200" , "DWY" : "9700" , "NKL" : "11300" , "EQD" : "2300" , "FBR" : "9300" , "HPS" : "9600" , "IBC" : "7600" , "IMO" : "12" , "INV" : "9500" , "JET" : "11600" , "LBV" : "11100" , "LHM" : "3800" , "LES" : "4800" , "LYD" : "8600" , "M2M" : "10000" , "MOX" : "7200" , "MAB" : "1600" , "MNG" : "7300" , "MLE" : "2500" , "IAM" : "8001" , "MDP" : "6500" , "MIC" : "10600" , "MUT" : "21" , "NEX" : "7400" , "OUL" : "5200" , "PRO" : "9900" , "REB" : "5300" , "RDS" : "12000" , "RISMA" : "8700" , "S2M" : "11800" , "SAH" : "11400" , "SLF" : "10700" , "SAM" : "6800" , "SMI" : "1500" , "SNA" : "10500" , "SNP" : "9400" , "MSA" : "12300" , "SID" : "1300" , "SOT" : "9800" , "SRM" : "2000" , "SBM" : "10400" , "STR" : "11500" , "TQM" : "11900" , "TIM" : "10100" , "TMA" : "12100" , "UMR" : "7500" , "WAA" : "6400" , "ZDJ" : "5800"}
+
+
 def ticker_2_CodeValeur(ticker):
-  ticker_2_CodeValeur = {"ADH" : "9000" , "AFM" : "12200" , "AFI" : "11700" , "GAZ" : "7100" , "AGM" : "6700" , "ADI" : "11200" , "ALM" : "6600" , "ARD" : "27" , "ATL" : "10300" , "ATW" : "8200" , "ATH" : "3200" , "NEJ" : "7000" , "BAL" : "3300" , "BOA" : "1100" , "BCP" : "8000" , "BCI" : "5100" , "CRS" : "8900" , "CDM" : "3600" , "CDA" : "3900" , "CIH" : "3100" , "CMA" : "4000" , "CMT" : "11000" , "COL" : "9200" , "CSR" : "4100" , "CTM" : "2200" , "DRI" : "8500" , "DLM" : "10800" , "DHO" : "10900" , "DIS" : "4200" , "DWY" : "9700" , "NKL" : "11300" , "EQD" : "2300" , "FBR" : "9300" , "HPS" : "9600" , "IBC" : "7600" , "IMO" : "12" , "INV" : "9500" , "JET" : "11600" , "LBV" : "11100" , "LHM" : "3800" , "LES" : "4800" , "LYD" : "8600" , "M2M" : "10000" , "MOX" : "7200" , "MAB" : "1600" , "MNG" : "7300" , "MLE" : "2500" , "IAM" : "8001" , "MDP" : "6500" , "MIC" : "10600" , "MUT" : "21" , "NEX" : "7400" , "OUL" : "5200" , "PRO" : "9900" , "REB" : "5300" , "RDS" : "12000" , "RISMA" : "8700" , "S2M" : "11800" , "SAH" : "11400" , "SLF" : "10700" , "SAM" : "6800" , "SMI" : "1500" , "SNA" : "10500" , "SNP" : "9400" , "MSA" : "12300" , "SID" : "1300" , "SOT" : "9800" , "SRM" : "2000" , "SBM" : "10400" , "STR" : "11500" , "TQM" : "11900" , "TIM" : "10100" , "TMA" : "12100" , "UMR" : "7500" , "WAA" : "6400" , "ZDJ" : "5800"}
-  return ticker_2_CodeValeur[ticker]
+  return _TICKER_TO_CODE[ticker]
+
+
+@st.cache_data(ttl=3600)
+def load_stocks():
+  return py.get_stocks(country='morocco')
+
+
+@st.cache_data(ttl=3600)
+def load_history(ticker, start, end):
+  return py.get_stock_historical_data(stock=ticker, country='morocco', from_date=start, to_date=end)
 
 
+# One session for all the reruns of the script, so the connection is pooled
+@st.cache_resource
+def get_session():
+  return requests.Session()
+
+
+@st.cache_data(ttl=86400)
 def get_image(ticker):                                                           
   url = "https://www.casablanca-bourse.com/bourseweb/Societe-Cote.aspx?codeValeur="+str(ticker_2_CodeValeur(ticker))+"&cat=7"
-  req = requests.get(url)
-  soup = BeautifulSoup(req.text, "html.parser")
-  logo_path = soup.find("input", {"id": "SocieteCotee1_imgLogo"})['src']
-  logo_url = 'https://www.casablanca-bourse.com/bourseweb/' + logo_path
+  req = get_session().get(url, timeout=5)
+  soup = BeautifulSoup(req.text, "lxml")
+  logo = soup.find("input", {"id": "SocieteCotee1_imgLogo"})
+  # No logo when the page markup changed
+  if logo is None or not logo.get('src'):
+    return None
+  logo_url = 'https://www.casablanca-bourse.com/bourseweb/' + logo['src']
   return logo_url
 
 apptitle = 'Projet hiba'
@@ -32,11 +53,6 @@ st.set_page_config(page_title=apptitle, page_icon=":chart_with_upwards_trend:")
 # Title the app
 st.title('Titre')
 
-# @st.cache(ttl=3600, max_entries=10)   #-- Magic command to cache data
-
-# @st.cache(ttl=3600, max_entries=10)   #-- Magic command to cache data
-
-
 st.sidebar.markdown('<center><img src="http://www.ansamble-maroc.com/wp-content/uploads/2016/08/LMV-LOGO-Copie.jpg" width="300"  height="100" alt="Marocaine vie "></center>', unsafe_allow_html=True)
 
 st.sidebar.markdown("## Selectioner le titre et la periode ")
@@ -45,7 +61,8 @@ st.markdown("Sous l'encadrement de Pr...")
 st.markdown('__________________________________________________________')
 
 
-dropdown = st.sidebar.selectbox("Choisir une action", py.get_stocks(country='morocco').name)
+stocks = load_stocks().set_index("name")
+dropdown = st.sidebar.selectbox("Choisir une action", stocks.index)
 indicateur = st.sidebar.selectbox("Choisir un indicateur", ['MACD','RSI'])
 
 ma = st.sidebar.selectbox("Periode de calcule de la moyenne mobile (en jours)", [15,30,45,60])
@@ -58,19 +75,17 @@ end = st.sidebar.date_input('Fin', value = pd.to_datetime('today'))
 start = start.strftime('%d/%m/%Y')
 end = end.strftime('%d/%m/%Y')
 
-stocks = py.get_stocks(country='morocco')
-stocks.set_index("name", inplace = True)
-ticker =  stocks.loc[dropdown,'symbol']
+ticker = stocks.at[dropdown,'symbol']
 
-df=py.get_stock_historical_data(stock=ticker, country='morocco', from_date=start, to_date=end)
+df=load_history(ticker, start, end)
 
 
 
 
 url = get_image(ticker)
-url = str(url)
 
-st.markdown('<center><img src="'+url+'" alt="stock logo"></center>', unsafe_allow_html=True) # logo de l'action
+if url is not None:
+  st.markdown('<center><img src="'+url+'" alt="stock logo"></center>', unsafe_allow_html=True) # logo de l'action
 st.markdown('__________________________________________________________')
 if indicateur == 'MACD':
   c1, c2 = st.columns(2)
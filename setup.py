@@ -43,5 +43,6 @@ setuptools.setup(name='tti',
     author_email='vsaveris@gmail.com',
     license='MIT',
     packages=setuptools.find_packages(),
-    install_requires=['pandas>=1.2.0', 'matplotlib>=3.3.3', 'numpy>=1.19.4', 'statsmodels>=0.12.1'],
+    install_requires=['pandas>=1.2.0', 'matplotlib>=3.3.3', 'numpy>=1.19.4', 'scipy>=1.5.4', 'statsmodels>=0.12.1'],
+    extras_require={'numba': ['numba>=0.53.0'], 'polars': ['polars>=0.15.0']},
     python_requires=">=3.8")
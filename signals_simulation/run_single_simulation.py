@@ -76,9 +76,17 @@ if __name__ == '__main__':
                                       sys.argv[1]):
         indicator_class_name = sys.argv[1]
 
+    if indicator_class_name is None:
+        print('Invalid technical indicator, expected',
+              'tti.indicators.<indicator_class_name>')
+        exit()
+
+    # Class lookup in the package namespace, instead of evaluating the
+    # command line argument
     try:
-        indicator = eval(indicator_class_name)
-    except:
+        indicator = getattr(tti.indicators,
+                            indicator_class_name.rsplit('.', 1)[1])
+    except AttributeError:
         print('Invalid technical indicator', indicator_class_name)
         exit()
 
@@ -0,0 +1,84 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_all_signals.py
+    tti.indicators package, unit tests of the getAllSignals method, used by
+    the getTiSimulation method instead of calling getTiSignal in each
+    simulation round.
+"""
+
+import unittest
+import pandas as pd
+
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'tti', 'indicators'))
+from _chaikin_oscillator import ChaikinOscillator
+from _momentum import Momentum
+from _relative_strength_index import RelativeStrengthIndex
+from _triple_exponential_moving_average import TripleExponentialMovingAverage
+from _volume_rate_of_change import VolumeRateOfChange
+
+
+class TestGetAllSignals(unittest.TestCase):
+
+    indicators = [ChaikinOscillator, Momentum, RelativeStrengthIndex,
+                  TripleExponentialMovingAverage, VolumeRateOfChange]
+
+    @classmethod
+    def setUpClass(cls):
+        df = pd.read_csv('./data/sample_data.csv', parse_dates=True,
+                         index_col=0)
+
+        # Enough periods for the signals of all the indicators to change
+        cls.df = df.sort_index().iloc[-600:]
+
+    @staticmethod
+    def getRoundSignals(ti):
+        """
+        Calls the getTiSignal method with the data up to each period, as the
+        getTiSimulation rounds of indicators without getAllSignals do.
+        """
+
+        full_ti_data = ti._ti_data
+        full_input_data = ti._input_data
+
+        signals = []
+        for i in range(len(full_ti_data.index)):
+            ti._input_data = full_input_data.iloc[:i + 1]
+            ti._ti_data = full_ti_data.iloc[:i + 1]
+
+            signals.append(ti.getTiSignal()[1])
+
+        ti._ti_data = full_ti_data
+        ti._input_data = full_input_data
+
+        return signals
+
+    def test_getAllSignals(self):
+        for indicator in self.indicators:
+            with self.subTest(indicator=indicator.__name__):
+                ti = indicator(self.df)
+
+                all_signals = list(ti.getAllSignals())
+
+                self.assertListEqual(all_signals, self.getRoundSignals(ti))
+
+                # Not all the rounds hold
+                self.assertGreater(len(set(all_signals)), 1)
+
+    def test_getTiSimulation(self):
+        for indicator in self.indicators:
+            with self.subTest(indicator=indicator.__name__):
+                ti = indicator(self.df)
+
+                simulation_data, _, _ = ti.getTiSimulation(
+                    self.df[['close']])
+
+                self.assertListEqual(list(simulation_data['signal']), [
+                    {-1: 'buy', 0: 'hold', 1: 'sell'}[signal]
+                    for signal in self.getRoundSignals(ti)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_input_dtype.py
+    tti.indicators package, unit tests of indicators calculated on float32
+    input arrays, set by the _input_dtype of a subclass.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'tti', 'indicators'))
+from _relative_strength_index import RelativeStrengthIndex
+from _triple_exponential_moving_average import TripleExponentialMovingAverage
+from _volume_rate_of_change import VolumeRateOfChange
+
+
+class TestInputDtype(unittest.TestCase):
+
+    indicators = [RelativeStrengthIndex, TripleExponentialMovingAverage,
+                  VolumeRateOfChange]
+
+    df = pd.read_csv('./data/sample_data.csv', parse_dates=True, index_col=0)
+
+    def test_float32_subclass(self):
+        for indicator in self.indicators:
+            with self.subTest(indicator=indicator.__name__):
+
+                float32_indicator = type('Float32' + indicator.__name__,
+                                         (indicator,),
+                                         {'_input_dtype': np.float32})
+
+                ti = float32_indicator(self.df)
+
+                self.assertEqual(ti._properties,
+                                 indicator(self.df)._properties)
+
+                for values in ti._input_arrays.values():
+                    self.assertEqual(values.dtype, np.float32)
+
+                pd.testing.assert_frame_equal(
+                    ti.getTiData(), indicator(self.df).getTiData(),
+                    check_dtype=False, rtol=1e-4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_momentum_signal.py
+    tti.indicators package, _momentum.py module trading signal unit tests.
+"""
+
+import unittest
+from unittest import mock
+import pandas as pd
+
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'tti', 'indicators'))
+import _momentum
+from _momentum import Momentum
+
+
+class TestMomentumSignal(unittest.TestCase):
+
+    df = pd.read_csv('./data/sample_data.csv', parse_dates=True, index_col=0)
+
+    def test_ema_not_in_ti_data(self):
+        self.assertListEqual(list(Momentum(self.df).getTiData().columns),
+                             ['close', 'MOM', 'MOMsignal'])
+
+    def test_getTiSignal_uses_cached_ema(self):
+        ti = Momentum(self.df)
+
+        with mock.patch.object(_momentum, '_momentumEma') as momentum_ema:
+            ti.getTiSignal()
+
+            # Not enough data for calculating trading signal
+            full_ti_data = ti._ti_data
+            ti._ti_data = full_ti_data.iloc[:5]
+            self.assertEqual(ti.getTiSignal(), ('hold', 0))
+            ti._ti_data = full_ti_data
+
+            ti.getAllSignals()
+
+        momentum_ema.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_parallel.py
+    tti.indicators package, _parallel.py module unit tests.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'tti', 'indicators'))
+from _parallel import computeAll, computeTemaBatch
+from _relative_strength_index import RelativeStrengthIndex
+from _triple_exponential_moving_average import \
+    TripleExponentialMovingAverage, _temaKernel, _temaFilter
+from _volume_rate_of_change import VolumeRateOfChange
+from utils.exceptions import WrongValueForInputParameter
+
+
+class TestComputeAll(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        df = pd.read_csv('./data/sample_data.csv', parse_dates=True,
+                         index_col=0)
+
+        cls.input_data = {'t3': df, 't1': df.iloc[:1000], 't2': df.iloc[500:]}
+
+    def assertResultsEqual(self, results, period=None):
+        parameters = {} if period is None else {'period': period}
+
+        for ticker, data in self.input_data.items():
+            pd.testing.assert_frame_equal(
+                results[ticker]['rsi'],
+                RelativeStrengthIndex(data, **parameters).getTiData())
+
+            pd.testing.assert_frame_equal(
+                results[ticker]['tema'],
+                TripleExponentialMovingAverage(data, **parameters).getTiData())
+
+            pd.testing.assert_frame_equal(
+                results[ticker]['vrc'],
+                VolumeRateOfChange(data, **parameters).getTiData())
+
+    def test_process_backend(self):
+        self.assertResultsEqual(computeAll(self.input_data, pool_size=2))
+
+    def test_thread_backend(self):
+        self.assertResultsEqual(computeAll(self.input_data, pool_size=2,
+                                           backend='thread'))
+
+    def test_period(self):
+        for backend in ['process', 'thread']:
+            with self.subTest(backend=backend):
+                self.assertResultsEqual(
+                    computeAll(self.input_data, period=10, pool_size=2,
+                               backend=backend), period=10)
+
+    def test_result_order(self):
+        for backend in ['process', 'thread']:
+            with self.subTest(backend=backend):
+                results = computeAll(self.input_data, pool_size=2,
+                                     backend=backend)
+
+                self.assertListEqual(list(results), ['t3', 't1', 't2'])
+
+                for ticker in results:
+                    self.assertListEqual(list(results[ticker]),
+                                         ['rsi', 'tema', 'vrc'])
+
+    def test_empty_input(self):
+        for backend in ['process', 'thread']:
+            with self.subTest(backend=backend):
+                self.assertDictEqual(computeAll({}, backend=backend), {})
+
+    def test_wrong_backend(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            computeAll(self.input_data, backend='pandas')
+
+
+class TestComputeTemaBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        df = pd.read_csv('./data/sample_data.csv', parse_dates=True,
+                         index_col=0)
+
+        close = df['close'].to_numpy(dtype=np.float64)
+        cls.prices = np.column_stack([close, close[::-1], close * 2.0])
+
+    def test_columns(self):
+        tema = computeTemaBatch(self.prices, 20, pool_size=2)
+
+        self.assertTupleEqual(tema.shape, self.prices.shape)
+
+        for i in range(self.prices.shape[1]):
+            close = np.ascontiguousarray(self.prices[:, i])
+
+            with self.subTest(column=i):
+                np.testing.assert_allclose(tema[:, i],
+                                           _temaKernel(close, 20))
+                np.testing.assert_allclose(tema[:, i],
+                                           _temaFilter(close, 20))
+
+    def test_no_columns(self):
+        tema = computeTemaBatch(np.empty((100, 0)), 20)
+
+        self.assertTupleEqual(tema.shape, (100, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
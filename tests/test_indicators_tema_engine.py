@@ -0,0 +1,47 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_indicators_tema_engine.py
+    tti.indicators package, _triple_exponential_moving_average.py module
+    calculation engine unit tests.
+"""
+
+import unittest
+import pandas as pd
+
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                             'tti', 'indicators'))
+from _triple_exponential_moving_average import TripleExponentialMovingAverage
+from utils.exceptions import WrongValueForInputParameter
+from utils.jit import NUMBA_AVAILABLE
+
+
+class TestTripleExponentialMovingAverageEngine(unittest.TestCase):
+
+    df = pd.read_csv('./data/sample_data.csv', parse_dates=True, index_col=0)
+
+    @unittest.skipIf(not NUMBA_AVAILABLE, 'numba is not installed')
+    def test_engines_match(self):
+        for period in [1, 5, 100]:
+            with self.subTest(period=period):
+                pd.testing.assert_frame_equal(
+                    TripleExponentialMovingAverage(
+                        self.df, period=period, engine='numba').getTiData(),
+                    TripleExponentialMovingAverage(
+                        self.df, period=period, engine='scipy').getTiData())
+
+    def test_default_engine(self):
+        pd.testing.assert_frame_equal(
+            TripleExponentialMovingAverage(self.df).getTiData(),
+            TripleExponentialMovingAverage(
+                self.df, engine='numba' if NUMBA_AVAILABLE else
+                'scipy').getTiData())
+
+    def test_wrong_engine(self):
+        with self.assertRaises(WrongValueForInputParameter):
+            TripleExponentialMovingAverage(self.df, engine='pandas')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_data_conversion.py
+    tti.utils package, data_conversion.py module unit tests.
+"""
+
+import unittest
+import pandas as pd
+
+from tti.utils import data_conversion as dc
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+@unittest.skipIf(pl is None, 'polars is not installed')
+class TestFromPolars(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.read_csv('./data/sample_data.csv', parse_dates=True,
+                              index_col=0)
+
+    def test_input_data_is_not_polars_dataframe(self):
+        with self.assertRaises(TypeError):
+            dc.fromPolars(self.df)
+
+    def test_date_column_missing(self):
+        with self.assertRaises(ValueError):
+            dc.fromPolars(pl.from_pandas(self.df.reset_index()),
+                          date_column='not_exist')
+
+    def test_conversion(self):
+        df_result = dc.fromPolars(pl.from_pandas(self.df.reset_index()))
+
+        self.assertIsInstance(df_result.index, pd.DatetimeIndex)
+
+        pd.testing.assert_frame_equal(df_result, self.df, check_freq=False)
+
+    def test_round_trip(self):
+        pd.testing.assert_frame_equal(dc.fromPolars(dc.toPolars(self.df)),
+                                      self.df, check_freq=False)
+
+
+@unittest.skipIf(pl is None, 'polars is not installed')
+class TestToPolars(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.read_csv('./data/sample_data.csv', parse_dates=True,
+                              index_col=0)
+
+    def test_ti_data_is_not_dataframe(self):
+        with self.assertRaises(TypeError):
+            dc.toPolars('No_DataFrame')
+
+    def test_conversion(self):
+        pl_result = dc.toPolars(self.df, date_column='day')
+
+        self.assertListEqual(pl_result.columns,
+                             ['day'] + list(self.df.columns))
+
+        self.assertListEqual(list(pl_result['day'].to_numpy()),
+                             list(self.df.index.to_numpy()))
+
+        for column in self.df.columns:
+            self.assertListEqual(list(pl_result[column].to_numpy()),
+                                 list(self.df[column].to_numpy()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -84,6 +84,20 @@ class TestValidateInputData(unittest.TestCase):
 
         self.assertListEqual(['close'], list(df_result.columns))
 
+    def test_input_data_columns_case_insensitive(self):
+        df = pd.read_csv('./data/sample_data.csv', parse_dates=True,
+                         index_col=0)
+        df.columns = [c.upper() for c in df.columns]
+
+        df_result = dv.validateInputData(input_data=df,
+                                         required_columns=['close'],
+                                         indicator_name='I')
+
+        self.assertListEqual(['close'], list(df_result.columns))
+
+        # The caller's data frame is not modified
+        self.assertIn('CLOSE', df.columns)
+
     def test_input_data_already_sorted(self):
         df = pd.read_csv('./data/sample_data_sorted.csv', parse_dates=True,
                          index_col=0)
@@ -0,0 +1,53 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_jit.py
+    tti.utils package, jit.py module unit tests.
+"""
+
+import unittest
+import numpy as np
+
+from tti.utils import jit
+
+
+class TestNjit(unittest.TestCase):
+
+    def test_decorator_without_arguments(self):
+
+        @jit.njit
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(1, 2), 3)
+
+    def test_decorator_with_arguments(self):
+
+        @jit.njit(cache=False)
+        def total(values):
+            result = 0.0
+            for i in range(values.shape[0]):
+                result += values[i]
+            return result
+
+        self.assertEqual(total(np.arange(5, dtype=np.float64)), 10.0)
+
+    def test_prange_in_parallel_decorator(self):
+
+        @jit.njit(parallel=True)
+        def squares(values):
+            result = np.zeros(values.shape[0])
+            for i in jit.prange(values.shape[0]):
+                result[i] = values[i] * values[i]
+            return result
+
+        np.testing.assert_array_equal(
+            squares(np.arange(4, dtype=np.float64)),
+            np.array([0.0, 1.0, 4.0, 9.0]))
+
+    def test_numba_available_flag(self):
+        self.assertIsInstance(jit.NUMBA_AVAILABLE, bool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: test_utils_moving_average.py
+    tti.utils package, moving_average.py module unit tests.
+"""
+
+import unittest
+import numpy as np
+import pandas as pd
+
+from tti.utils import moving_average as ma
+
+
+class TestExponentialMovingAverage(unittest.TestCase):
+
+    def test_empty_input(self):
+        self.assertEqual(ma.exponentialMovingAverage(np.empty(0), 5).shape,
+                         (0,))
+
+    def test_result_equals_pandas_ewm(self):
+        values = np.random.default_rng(0).normal(100.0, 5.0, 500)
+
+        for span in [1, 9, 26, 200]:
+            np.testing.assert_allclose(
+                ma.exponentialMovingAverage(values, span),
+                pd.Series(values).ewm(span=span, min_periods=span,
+                                      adjust=False).mean().to_numpy(),
+                rtol=1e-10)
+
+    def test_span_longer_than_input(self):
+        self.assertTrue(np.isnan(
+            ma.exponentialMovingAverage(np.arange(5.0), 10)).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,9 +13,30 @@ indicators from stocks data. The library provides an API for:
 Project site is https://www.trading-technical-indicators.org/
 """
 
-from tti import indicators
-from tti import utils
+import importlib
 
 __version__ = '0.2.2'
 
 __all__ = ['indicators', 'utils']
+
+
+def __getattr__(name):
+    """
+    Imports the tti subpackages on their first access, so that importing tti
+    (or only the tti.utils package) does not load all the indicators.
+
+    Args:
+        name (str): The name of the accessed attribute.
+
+    Returns:
+        module: The requested subpackage.
+
+    Raises:
+        AttributeError: The attribute is not a tti subpackage.
+    """
+
+    if name in __all__:
+        return importlib.import_module('.' + name, __name__)
+
+    raise AttributeError("module '" + __name__ + "' has no attribute '" +
+                         name + "'")
@@ -34,6 +34,7 @@ from ._moving_average_convergence_divergence import \
 from ._negative_volume_index import NegativeVolumeIndex
 from ._on_balance_volume import OnBalanceVolume
 from ._parabolic_sar import ParabolicSAR
+from ._parallel import computeAll, computeTemaBatch
 from ._performance import Performance
 from ._positive_volume_index import PositiveVolumeIndex
 from ._price_and_volume_trend import PriceAndVolumeTrend
@@ -87,4 +88,5 @@ __all__ = ['AccumulationDistributionLine', 'AverageTrueRange',
            'TypicalPrice', 'UltimateOscillator', 'VerticalHorizontalFilter',
            'VolatilityChaikins', 'VolumeOscillator', 'VolumeRateOfChange',
            'WeightedClose', 'WildersSmoothing',
-           'WilliamsAccumulationDistribution', 'WilliamsR']
+           'WilliamsAccumulationDistribution', 'WilliamsR', 'computeAll',
+           'computeTemaBatch']
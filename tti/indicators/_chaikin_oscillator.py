@@ -6,12 +6,89 @@ File name: _chaikin_oscillator.py
 """
 
 import pandas as pd
+import numpy as np
 import os, sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from _technical_indicator_cho import TechnicalIndicator
 #from _accumulation_distribution_line import AccumulationDistributionLine
 from utils.constants import TRADE_SIGNALS
 from utils.exceptions import NotEnoughInputData
+from utils.jit import njit, prange, NUMBA_AVAILABLE
+from utils.moving_average import exponentialMovingAverage
+
+
+@njit(cache=True)
+def _emaDifference(values, ws, wl):
+    """
+    Calculates the difference between a short and a long exponential moving
+    average of the given values, in a single pass. The moving averages are
+    calculated as the pandas ``ewm(adjust=False)`` ones.
+
+    Args:
+        values (numpy.ndarray): The input values.
+
+        ws (int): The span of the short exponential moving average.
+
+        wl (int): The span of the long exponential moving average.
+
+    Returns:
+        numpy.ndarray: The short minus the long exponential moving average.
+        The first ``max(ws, wl) - 1`` values are NaN.
+    """
+
+    alpha_s = 2.0 / (ws + 1)
+    alpha_l = 2.0 / (wl + 1)
+    min_periods = max(ws, wl)
+
+    ema_diff = np.empty(values.shape[0])
+    ema_s = values[0]
+    ema_l = values[0]
+
+    for i in range(values.shape[0]):
+        ema_s += alpha_s * (values[i] - ema_s)
+        ema_l += alpha_l * (values[i] - ema_l)
+
+        if i >= min_periods - 1:
+            ema_diff[i] = ema_s - ema_l
+        else:
+            ema_diff[i] = np.nan
+
+    return ema_diff
+
+
+@njit(parallel=True, cache=True)
+def _chaikinSignals(close, co):
+    """
+    Calculates the trading signal of every period, as returned by the
+    ``getTiSignal`` method when called with the data up to that period.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        co (numpy.ndarray): The Chaikin Oscillator.
+
+    Returns:
+        numpy.ndarray: The trading signal value of each period.
+    """
+
+    signals = np.zeros(co.shape[0], dtype=np.int8)
+
+    for i in prange(89, co.shape[0]):
+
+        # 90-periods moving average
+        ma_90 = close[i - 89:i + 1].mean()
+
+        # Buy signal when price above 90-MA and indicator upturns in the
+        # negative area
+        if close[i] > ma_90 and co[i - 1] < co[i] < 0.0:
+            signals[i] = -1
+
+        # Sell signal when price below 90-MA and indicator downturns in the
+        # positive area
+        elif close[i] < ma_90 and co[i - 1] > co[i] > 0.0:
+            signals[i] = 1
+
+    return signals
 
 
 class ChaikinOscillator(TechnicalIndicator):
@@ -62,30 +139,36 @@ class ChaikinOscillator(TechnicalIndicator):
         Raises:
             NotEnoughInputData: Not enough data for calculating the indicator.
         """
-        adl = pd.DataFrame(index=self._input_data.index, columns=['adl'],
-                           data=0, dtype='int64')
-
-        adl['adl'] = self._input_data['volume'] * (
-                (self._input_data['close'] - self._input_data['low']) -
-                (self._input_data['high'] - self._input_data['close'])
-        ) / (self._input_data['high'] - self._input_data['low'])
-
-        adl = adl.cumsum(axis=0)
-        
-
         # Not enough data for the requested period
         if len(self._input_data.index) < 10:
             raise NotEnoughInputData('Chaikin Oscillator', 10,
                                      len(self._input_data.index))
 
-        co = pd.DataFrame(index=self._input_data.index, columns=['co'],
-                          data=0, dtype='float64')
-
-        #adl = AccumulationDistributionLine(self._input_data).getTiData()
+        high = self._input_arrays['high']
+        low = self._input_arrays['low']
+        close = self._input_arrays['close']
+        volume = self._input_arrays['volume']
+
+        # Money Flow Multiplier, periods with high equal to low do not add
+        # any money flow volume
+        price_range = high - low
+        mfm = np.divide((close - low) - (high - close), price_range,
+                        out=np.zeros_like(price_range),
+                        where=price_range != 0)
+
+        # Accumulation Distribution Line, the money flow volume is accumulated
+        # in place
+        adl = np.multiply(volume, mfm, out=mfm)
+        np.cumsum(adl, out=adl)
+
+        if NUMBA_AVAILABLE:
+            co_values = _emaDifference(adl, ws, wl)
+        else:
+            co_values = (exponentialMovingAverage(adl, ws) -
+                         exponentialMovingAverage(adl, wl))
 
-        co['co'] = \
-            adl.ewm(span=ws, min_periods=ws, adjust=False, axis=0).mean() - \
-            adl.ewm(span=wl, min_periods=wl, adjust=False, axis=0).mean()
+        co = pd.DataFrame(index=self._input_data.index, columns=['co'],
+                          data=co_values, dtype='float64')
 
         return co
 
@@ -99,25 +182,39 @@ class ChaikinOscillator(TechnicalIndicator):
             signal.
         """
 
+        close = self._input_data['close'].to_numpy()
+        co = self._ti_data['co'].to_numpy()
+
         # Not enough data for calculating trading signal
-        if len(self._ti_data.index) < 90:
+        if co.shape[0] < 90:
             return TRADE_SIGNALS['hold']
 
         # 90-periods moving average
-        ma_90 = self._input_data['close'].iloc[-90:].mean()
+        ma_90 = close[-90:].mean()
 
         # Buy signal when price above 90-MA and indicator upturns in the
         # negative area
-        if self._input_data['close'].iat[-1] > ma_90 and \
-           self._ti_data['co'].iat[-2] < self._ti_data['co'].iat[-1] < 0.0:
+        if close[-1] > ma_90 and co[-2] < co[-1] < 0.0:
             return TRADE_SIGNALS['buy']
 
         # Sell signal when price below 90-MA and indicator downturns in the
         # positive area
-        elif self._input_data['close'].iat[-1] < ma_90 and \
-                self._ti_data['co'].iat[-2] > \
-                self._ti_data['co'].iat[-1] > 0.0:
+        elif close[-1] < ma_90 and co[-2] > co[-1] > 0.0:
             return TRADE_SIGNALS['sell']
 
         else:
             return TRADE_SIGNALS['hold']
+
+    def getAllSignals(self):
+        """
+        Calculates the trading signals for all the periods of the calculated
+        technical indicator, in a single pass. Equivalent to calling the
+        ``getTiSignal`` method for each period, with the data up to it.
+
+        Returns:
+            numpy.ndarray: The trading signal value of each period, one of
+            {0 (hold), -1 (buy), 1 (sell)}.
+        """
+
+        return _chaikinSignals(self._input_arrays['close'],
+                               self._ti_data['co'].to_numpy())
@@ -6,12 +6,138 @@ File name: _momentum.py
 """
 
 import pandas as pd
+import numpy as np
+from scipy.ndimage import convolve1d
 import os, sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from _technical_indicator_mom import TechnicalIndicator
 from utils.constants import TRADE_SIGNALS
 from utils.exceptions import NotEnoughInputData, WrongTypeForInputParameter,\
     WrongValueForInputParameter
+from utils.jit import njit, prange, NUMBA_AVAILABLE
+from utils.moving_average import exponentialMovingAverage
+
+
+@njit(cache=True)
+def _momentumKernel(close, period, wsig):
+    """
+    Calculates the momentum and its signal line (simple moving average of the
+    momentum) in a single pass.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int): The past periods to be used for the momentum.
+
+        wsig (int): The periods of the signal line moving average.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The momentum and the signal line.
+        Values which can not be calculated are NaN.
+    """
+
+    n = close.shape[0]
+    mom = np.full(n, np.nan)
+    mom_signal = np.full(n, np.nan)
+    window_sum = 0.0
+
+    for i in range(period, n):
+        mom[i] = close[i] - close[i - period]
+        window_sum += mom[i]
+
+        # Remove the value which left the signal line window
+        if i - period >= wsig:
+            window_sum -= mom[i - wsig]
+
+        if i - period >= wsig - 1:
+            mom_signal[i] = window_sum / wsig
+
+    return mom, mom_signal
+
+
+def _momentumConvolution(close, period, wsig):
+    """
+    Vectorized equivalent of the ``_momentumKernel``, used when numba is not
+    available. The signal line is calculated as a convolution of the momentum
+    with a constant ``1/wsig`` weights window.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int): The past periods to be used for the momentum.
+
+        wsig (int): The periods of the signal line moving average.
+
+    Returns:
+        (numpy.ndarray, numpy.ndarray): The momentum and the signal line.
+        Values which can not be calculated are NaN.
+    """
+
+    mom = np.full(close.shape[0], np.nan)
+    mom[period:] = close[period:] - close[:-period]
+
+    # Windows which include a NaN momentum or exceed the array start are NaN
+    mom_signal = convolve1d(mom, np.full(wsig, 1.0 / wsig), mode='constant',
+                            cval=np.nan, origin=-(wsig // 2))
+
+    return mom, mom_signal
+
+
+def _momentumEma(mom, span):
+    """
+    Calculates the exponential moving average of the momentum, used by the
+    trading signal. It starts at the first defined momentum value.
+
+    Args:
+        mom (numpy.ndarray): The momentum.
+
+        span (int): The span of the exponential moving average, calculated
+            as the pandas ``ewm(span=span, min_periods=span, adjust=False)``
+            one.
+
+    Returns:
+        numpy.ndarray: The exponential moving average of the momentum. Values
+        which can not be calculated are NaN.
+    """
+
+    mom_ema = np.full(mom.shape[0], np.nan)
+    defined = np.flatnonzero(~np.isnan(mom))
+
+    if defined.shape[0] > 0:
+        mom_ema[defined[0]:] = exponentialMovingAverage(mom[defined[0]:],
+                                                        span)
+
+    return mom_ema
+
+
+@njit(parallel=True, cache=True)
+def _momentumSignals(mom, ema):
+    """
+    Calculates the trading signal of every period, as returned by the
+    ``getTiSignal`` method when called with the data up to that period.
+
+    Args:
+        mom (numpy.ndarray): The momentum.
+
+        ema (numpy.ndarray): The exponential moving average of the momentum.
+
+    Returns:
+        numpy.ndarray: The trading signal value of each period.
+    """
+
+    signals = np.zeros(mom.shape[0], dtype=np.int8)
+
+    for i in prange(8, mom.shape[0]):
+
+        # Indicator value goes above Moving Average
+        if mom[i - 1] < ema[i - 1] and mom[i] > ema[i]:
+            signals[i] = 1
+
+        # Indicator value goes below Moving Average
+        elif mom[i - 1] > ema[i - 1] and mom[i] < ema[i]:
+            signals[i] = -1
+
+    return signals
 
 
 class Momentum(TechnicalIndicator):
@@ -34,6 +160,9 @@ class Momentum(TechnicalIndicator):
         _ti_data (pandas.DataFrame): The calculated indicator. Index is of type
             ``pandas.DatetimeIndex``. It contains one column, the ``mom``.
 
+        _mom_ema (numpy.ndarray): The exponential moving average of the
+            momentum, calculated once for the trading signals.
+
         _properties (dict): Indicator properties.
 
         _calling_instance (str): The name of the class.
@@ -70,12 +199,20 @@ class Momentum(TechnicalIndicator):
                       wsig ; ordre de signal ligne
           Retour:   Momentume (pndas.DataFrame)
         """
-        MOM=pd.Series(self._input_data.close.diff(period),name="MOM")
-        MOMsignal=pd.Series(MOM.rolling(wsig, min_periods=wsig).mean(), name= "MOMsignal")
-        df=pd.DataFrame(self._input_data.close)
-        df=df.join(MOM)
-        df=df.join(MOMsignal)
-        return df
+        close = self._input_arrays['close']
+
+        if NUMBA_AVAILABLE:
+            mom, mom_signal = _momentumKernel(close, period, wsig)
+        else:
+            mom, mom_signal = _momentumConvolution(close, period, wsig)
+
+        # Short term moving average for determining the bottoming and
+        # peaking, kept out of the indicator data
+        self._mom_ema = _momentumEma(mom, wsig)
+
+        return pd.DataFrame(index=self._input_data.index,
+                            data={'close': close,
+                                  'MOM': mom, 'MOMsignal': mom_signal})
 
         """
         # Not enough data for the requested period
@@ -104,22 +241,38 @@ class Momentum(TechnicalIndicator):
             signal.
         """
 
+        n = len(self._ti_data.index)
+
         # Not enough data for calculating trading signal
-        if len(self._ti_data.index) < 9:
+        if n < 9:
             return TRADE_SIGNALS['hold']
 
-        # Short term moving average for determining the bottoming and peaking
-        ema = self._ti_data['mom'].ewm(span=9, min_periods=9, adjust=False,
-                                       axis=0).mean()
+        mom = self._ti_data['MOM'].to_numpy()
+
+        # The moving average is causal, so its values up to the last period
+        # of the (possibly limited) indicator data are read from the cache
+        ema_previous, ema_last = self._mom_ema[n - 2], self._mom_ema[n - 1]
 
         # Indicator value goes above Moving Average
-        if self._ti_data['mom'].iat[-2] < ema[-2] and \
-                self._ti_data['mom'].iat[-1] > ema[-1]:
+        if mom[-2] < ema_previous and mom[-1] > ema_last:
             return TRADE_SIGNALS['sell']
 
         # Indicator value goes below Moving Average
-        if self._ti_data['mom'].iat[-2] > ema[-2] and \
-                self._ti_data['mom'].iat[-1] < ema[-1]:
+        if mom[-2] > ema_previous and mom[-1] < ema_last:
             return TRADE_SIGNALS['buy']
 
         return TRADE_SIGNALS['hold']
+
+    def getAllSignals(self):
+        """
+        Calculates the trading signals for all the periods of the calculated
+        technical indicator, in a single pass. Equivalent to calling the
+        ``getTiSignal`` method for each period, with the data up to it.
+
+        Returns:
+            numpy.ndarray: The trading signal value of each period, one of
+            {0 (hold), -1 (buy), 1 (sell)}.
+        """
+
+        return _momentumSignals(self._ti_data['MOM'].to_numpy(),
+                                self._mom_ema)
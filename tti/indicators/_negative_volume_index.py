@@ -6,6 +6,7 @@ File name: _negative_volume_index.py
 """
 
 import pandas as pd
+import numpy as np
 import os, sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from _technical_indicator_nvi import TechnicalIndicator
@@ -67,25 +68,21 @@ class NegativeVolumeIndex(TechnicalIndicator):
             raise NotEnoughInputData('Negative Volume Index', 2,
                                      len(self._input_data.index))
 
-        nvi = pd.DataFrame(index=self._input_data.index, columns=['nvi'],
-                           data=None, dtype='float64')
+        volume = self._input_arrays['volume']
+        close = self._input_arrays['close']
 
-        nvi['nvi'].iat[0] = 1000.0
+        nvi = np.empty(close.shape[0])
+        nvi[0] = 1000.0
 
-        for i in range(1, len(self._input_data.index)):
+        for i in range(1, close.shape[0]):
 
-            if self._input_data['volume'].iat[i] < \
-                    self._input_data['volume'].iat[i - 1]:
-                nvi['nvi'].iat[i] = \
-                    nvi['nvi'].iat[i - 1] + (
-                            self._input_data['close'].iat[i] -
-                            self._input_data['close'].iat[i - 1]) * (
-                            nvi['nvi'].iat[i - 1] /
-                            self._input_data['close'].iat[i - 1])
+            if volume[i] < volume[i - 1]:
+                nvi[i] = nvi[i - 1] + (close[i] - close[i - 1]) * (
+                    nvi[i - 1] / close[i - 1])
             else:
-                nvi['nvi'].iat[i] = nvi['nvi'].iat[i - 1]
-        NVI = nvi['nvi'].ewm(span=period, min_periods=period, adjust=False,
-                                       axis=0).mean()
+                nvi[i] = nvi[i - 1]
+        NVI = pd.Series(nvi, index=self._input_data.index).ewm(
+            span=period, min_periods=period, adjust=False, axis=0).mean()
         #NVI=pd.DataFrame()
         NVI=pd.DataFrame({'Date':NVI.index, 'NVI':NVI.values})
         
@@ -0,0 +1,209 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: _parallel.py
+    Calculation of the Relative Strength Index, Triple Exponential Moving
+    Average and Volume Rate of Change for several tickers in parallel.
+"""
+
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from _relative_strength_index import RelativeStrengthIndex
+from _triple_exponential_moving_average import \
+    TripleExponentialMovingAverage, _temaKernel, _temaFilter
+from _volume_rate_of_change import VolumeRateOfChange
+from utils.exceptions import WrongValueForInputParameter
+from utils.jit import NUMBA_AVAILABLE
+
+# Process pool reused by the computeAll calls, created on first use
+_process_executor = None
+_process_executor_workers = None
+
+
+def _computeTicker(input_data, period):
+    """
+    Calculates the indicators for the input data of one ticker.
+
+    Args:
+        input_data (pandas.DataFrame): The input data of the ticker. Required
+            input columns are ``close`` and ``volume``. The index is of type
+            ``pandas.DatetimeIndex``.
+
+        period (int or None): The period of the indicators. If None, the
+            default period of each indicator is used.
+
+    Returns:
+        dict: The calculated indicators, with keys ``rsi``, ``tema`` and
+        ``vrc``.
+    """
+
+    # The indicators are calculated once, at their construction
+    parameters = {} if period is None else {'period': period}
+
+    return {'rsi': RelativeStrengthIndex(input_data, **parameters).getTiData(),
+            'tema': TripleExponentialMovingAverage(
+                input_data, **parameters).getTiData(),
+            'vrc': VolumeRateOfChange(input_data, **parameters).getTiData()}
+
+
+def _computeTickers(input_data, period):
+    """
+    Calculates the indicators for the input data of several tickers, so that
+    a worker receives and returns them in a single task.
+
+    Args:
+        input_data (dict): The input data of each ticker, ticker as key and
+            ``pandas.DataFrame`` as value.
+
+        period (int or None): The period of the indicators. If None, the
+            default period of each indicator is used.
+
+    Returns:
+        dict: The calculated indicators of each ticker, ticker as key.
+    """
+
+    return {ticker: _computeTicker(data, period)
+            for ticker, data in input_data.items()}
+
+
+def _getProcessExecutor(max_workers):
+    """
+    Returns the process pool used by the ``computeAll`` method. The pool is
+    created on first use and kept for the next calls, so that the worker
+    processes are started only once. It is recreated when a different number
+    of workers is requested. The workers are spawned, so scripts calling
+    ``computeAll`` must be protected by an ``if __name__ == '__main__'``
+    block.
+
+    Args:
+        max_workers (int): The number of the worker processes.
+
+    Returns:
+        concurrent.futures.ProcessPoolExecutor: The process pool.
+    """
+
+    global _process_executor, _process_executor_workers
+
+    if _process_executor is None or _process_executor_workers != max_workers:
+
+        if _process_executor is not None:
+            _process_executor.shutdown()
+
+        # Forking after the numba threading layer has started can deadlock the
+        # workers, so they are started as new interpreters
+        _process_executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context('spawn'))
+        _process_executor_workers = max_workers
+
+    return _process_executor
+
+
+def computeAll(input_data, period=None, pool_size=None, backend='process'):
+    """
+    Calculates the Relative Strength Index, the Triple Exponential Moving
+    Average and the Volume Rate of Change for each ticker, in a pool of
+    workers. The tickers are split in one chunk per worker, so each worker
+    receives its input data and returns its results in a single task.
+
+    Args:
+        input_data (dict): The input data of each ticker, ticker as key and
+            ``pandas.DataFrame`` as value. Required input columns are
+            ``close`` and ``volume``. The index is of type
+            ``pandas.DatetimeIndex``.
+
+        period (int, default=None): The period of the indicators. If None, the
+            default period of each indicator is used.
+
+        pool_size (int, default=None): The number of the workers. If None, the
+            number of the available cpus is used.
+
+        backend ({'process', 'thread'}, default='process'): The kind of the
+            workers. ``process`` runs the tickers in a pool of processes, kept
+            for the next calls, and the input data are copied to them.
+            ``thread`` runs them in a pool of threads of this process, without
+            copying the input data. It scales only as far as the
+            calculations release the GIL, as the numba kernels compiled with
+            ``nogil`` do.
+
+    Returns:
+        dict: The calculated indicators of each ticker, ticker as key. Each
+        value is a dictionary with keys ``rsi``, ``tema`` and ``vrc``, and the
+        ``pandas.DataFrame`` of the calculated indicator as value.
+
+    Raises:
+        WrongValueForInputParameter: Unsupported value for input argument.
+    """
+
+    if backend not in ['process', 'thread']:
+        raise WrongValueForInputParameter(backend, 'backend',
+                                          "'process', 'thread'")
+
+    max_workers = pool_size or os.cpu_count()
+
+    if backend == 'thread':
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    else:
+        executor = _getProcessExecutor(max_workers)
+
+    tickers = list(input_data)
+    chunks = [tickers[i::max_workers] for i in range(max_workers)]
+
+    try:
+        futures = [executor.submit(
+            _computeTickers, {ticker: input_data[ticker] for ticker in chunk},
+            period) for chunk in chunks if chunk]
+
+        results = {}
+        for future in futures:
+            results.update(future.result())
+
+        # Same order of the tickers as in the input data
+        return {ticker: results[ticker] for ticker in tickers}
+
+    finally:
+        # Only the process pool is kept for the next calls
+        if backend == 'thread':
+            executor.shutdown()
+
+
+def computeTemaBatch(prices, period, pool_size=None):
+    """
+    Calculates the Triple Exponential Moving Average of each column of the
+    given prices, in a pool of threads (one column per task). The numba
+    kernel is compiled with ``nogil``, so the threads run in parallel without
+    copying the prices to other processes. Without numba the ``lfilter``
+    calculation is used instead.
+
+    Args:
+        prices (numpy.ndarray): The close prices, of shape (periods,
+            tickers).
+
+        period (int): The span of the exponential moving averages.
+
+        pool_size (int, default=None): The number of the worker threads. If
+            None, the number of the available cpus is used.
+
+    Returns:
+        numpy.ndarray: The Triple Exponential Moving Average of each column,
+        of the same shape as ``prices`` (in Fortran order). The first
+        ``3 * (period - 1)`` values of each column are NaN.
+    """
+
+    # Contiguous float64 array per ticker
+    columns = np.ascontiguousarray(np.asarray(prices, dtype=np.float64).T)
+
+    calculate = _temaKernel if NUMBA_AVAILABLE else _temaFilter
+
+    with ThreadPoolExecutor(
+            max_workers=pool_size or os.cpu_count()) as executor:
+
+        tema = list(executor.map(lambda close: calculate(close, period),
+                                 columns))
+
+    # Each ticker is copied as one contiguous row, the returned array is the
+    # transposed (column per ticker) view of them
+    return (np.stack(tema) if tema else np.empty(columns.shape)).T
@@ -6,6 +6,7 @@ File name: _positive_volume_index.py
 """
 
 import pandas as pd
+import numpy as np
 
 from _technical_indicator import TechnicalIndicator
 from utils.constants import TRADE_SIGNALS
@@ -66,25 +67,22 @@ class PositiveVolumeIndex(TechnicalIndicator):
             raise NotEnoughInputData('Positive Volume Index', 2,
                                      len(self._input_data.index))
 
-        pvi = pd.DataFrame(index=self._input_data.index, columns=['pvi'],
-                           data=None, dtype='float64')
+        volume = self._input_arrays['volume']
+        close = self._input_arrays['close']
 
-        pvi['pvi'].iat[0] = 1000.0
+        pvi = np.empty(close.shape[0])
+        pvi[0] = 1000.0
 
-        for i in range(1, len(self._input_data.index)):
+        for i in range(1, close.shape[0]):
 
-            if self._input_data['volume'].iat[i] > \
-                    self._input_data['volume'].iat[i - 1]:
-                pvi['pvi'].iat[i] = \
-                    pvi['pvi'].iat[i - 1] + (
-                            self._input_data['close'].iat[i] -
-                            self._input_data['close'].iat[i - 1]) * (
-                            pvi['pvi'].iat[i - 1] /
-                            self._input_data['close'].iat[i - 1])
+            if volume[i] > volume[i - 1]:
+                pvi[i] = pvi[i - 1] + (close[i] - close[i - 1]) * (
+                    pvi[i - 1] / close[i - 1])
             else:
-                pvi['pvi'].iat[i] = pvi['pvi'].iat[i - 1]
+                pvi[i] = pvi[i - 1]
 
-        return pvi
+        return pd.DataFrame(index=self._input_data.index, columns=['pvi'],
+                            data=pvi)
 
     def getTiSignal(self):
         """
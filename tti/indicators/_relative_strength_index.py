@@ -6,13 +6,105 @@ File name: _relative_strength_index.py
 """
 
 import pandas as pd
-import numpy as np 
+import numpy as np
+from scipy.signal import lfilter
 import os, sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from _technical_indicator_rsi import TechnicalIndicator
 from utils.constants import TRADE_SIGNALS
 from utils.exceptions import NotEnoughInputData, WrongTypeForInputParameter,\
     WrongValueForInputParameter
+from utils.jit import njit, prange, NUMBA_AVAILABLE
+
+
+@njit(nogil=True, cache=True)
+def _wildersSmoothing(values, period):
+    """
+    Calculates the Wilder's smoothing (moving average with ``1/period``
+    weight for the new value) of the given values, in a single pass. It is
+    seeded with the simple average of the first ``period`` values.
+
+    Args:
+        values (numpy.ndarray): The input values, without missing values.
+
+        period (int): The smoothing period.
+
+    Returns:
+        numpy.ndarray: The smoothed values. The first ``period - 1`` values
+        are NaN.
+    """
+
+    smoothed = np.full(values.shape[0], np.nan)
+
+    if values.shape[0] < period:
+        return smoothed
+
+    average = values[:period].mean()
+    smoothed[period - 1] = average
+
+    for i in range(period, values.shape[0]):
+        average = (average * (period - 1) + values[i]) / period
+        smoothed[i] = average
+
+    return smoothed
+
+
+def _wildersSmoothingFilter(values, period):
+    """
+    Vectorized equivalent of the ``_wildersSmoothing``, used when numba is not
+    available. The recursion is executed as a first order filter.
+
+    Args:
+        values (numpy.ndarray): The input values, without missing values.
+
+        period (int): The smoothing period.
+
+    Returns:
+        numpy.ndarray: The smoothed values. The first ``period - 1`` values
+        are NaN.
+    """
+
+    smoothed = np.full(values.shape[0], np.nan)
+
+    if values.shape[0] < period:
+        return smoothed
+
+    alpha = 1.0 / period
+    smoothed[period - 1] = values[:period].mean()
+
+    smoothed[period:], _ = lfilter(
+        [alpha], [1.0, alpha - 1.0], values[period:],
+        zi=[(1.0 - alpha) * smoothed[period - 1]])
+
+    return smoothed
+
+
+@njit(parallel=True, cache=True)
+def _rsiSignals(rsi):
+    """
+    Calculates the trading signal of every period, as returned by the
+    ``getTiSignal`` method when called with the data up to that period.
+
+    Args:
+        rsi (numpy.ndarray): The relative strength index.
+
+    Returns:
+        numpy.ndarray: The trading signal value of each period.
+    """
+
+    signals = np.zeros(rsi.shape[0], dtype=np.int8)
+
+    for i in prange(1, rsi.shape[0]):
+
+        # Overbought region
+        if rsi[i - 1] < 70. < rsi[i]:
+            signals[i] = 1
+
+        # Oversold region
+        elif rsi[i - 1] > 30. > rsi[i]:
+            signals[i] = -1
+
+    return signals
 
 
 class RelativeStrengthIndex(TechnicalIndicator):
@@ -46,8 +138,8 @@ class RelativeStrengthIndex(TechnicalIndicator):
         TypeError: Type error occurred when validating the ``input_data``.
         ValueError: Value error occurred when validating the ``input_data``.
     """
-    def __init__(self, input_data, fill_missing_values=True):
-        """
+    def __init__(self, input_data, period=14, fill_missing_values=True):
+
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -58,7 +150,7 @@ class RelativeStrengthIndex(TechnicalIndicator):
         else:
             raise WrongTypeForInputParameter(
                 type(period), 'period', 'int')
-       """
+
         # Control is passing to the parent class
         super().__init__(calling_instance=self.__class__.__name__,
                          input_data=input_data,
@@ -66,7 +158,8 @@ class RelativeStrengthIndex(TechnicalIndicator):
 
     def _calculateTi(self,period):
         """
-         Relative Strength index
+         Relative Strength index, with the average gain and loss calculated
+         with the Wilder's smoothing.
           :Paramètre:
            df: pandas.DataFrame
            n : ordre
@@ -74,21 +167,34 @@ class RelativeStrengthIndex(TechnicalIndicator):
            pandas.DataFrame
 
         """
-        diff=self._input_data.diff(1)
-        t=[]
-        for i in diff.values :
-            if i > 0:
-                t.append(i)
-            else :
-                t.append(0)
-        pos=pd.DataFrame(t,index=self._input_data.index)
-        diff=np.abs(pd.DataFrame(diff))
-        RSI=pos.rolling(period,min_periods=period).sum()/np.array((diff.rolling(period,min_periods=period).sum()))
-        df=pd.DataFrame(self._input_data)
-        df=df.join(RSI)
-        df.columns=["COURS_CLOTURE","rsi"] 
-        return df
-    
+        rsi = np.full(len(self._input_data.index), np.nan)
+
+        # The first price change is not defined, the gains and losses are
+        # calculated in place from the flat price changes array
+        close = self._input_arrays['close']
+        loss = np.subtract(close[:-1], close[1:])
+        gain = np.negative(loss)
+        np.maximum(gain, 0.0, out=gain)
+        np.maximum(loss, 0.0, out=loss)
+
+        if NUMBA_AVAILABLE:
+            avg_gain = _wildersSmoothing(gain, period)
+            avg_loss = _wildersSmoothing(loss, period)
+        else:
+            avg_gain = _wildersSmoothingFilter(gain, period)
+            avg_loss = _wildersSmoothingFilter(loss, period)
+
+        # RSI is 100 when there is no loss in the period, and undefined when
+        # the price did not change at all
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rsi[1:] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+        # Built from arrays, the columns share the input index
+        return pd.DataFrame(
+            index=self._input_data.index,
+            data={'COURS_CLOTURE': self._input_data['close'].to_numpy(),
+                  'rsi': rsi})
+
     def getTiSignal(self):
         """
         Calculates and returns the trading signal for the calculated technical
@@ -99,16 +205,31 @@ class RelativeStrengthIndex(TechnicalIndicator):
             signal.
         """
 
+        rsi = self._ti_data['rsi'].to_numpy()
+
         # Not enough data for calculating trading signal
-        if len(self._ti_data.index) < 2:
+        if rsi.shape[0] < 2:
             return TRADE_SIGNALS['hold']
 
         # Overbought region
-        if self._ti_data['rsi'].iat[-2] < 70. < self._ti_data['rsi'].iat[-1]:
+        if rsi[-2] < 70. < rsi[-1]:
             return TRADE_SIGNALS['sell']
 
         # Oversold region
-        if self._ti_data['rsi'].iat[-2] > 30. > self._ti_data['rsi'].iat[-1]:
+        if rsi[-2] > 30. > rsi[-1]:
             return TRADE_SIGNALS['buy']
 
         return TRADE_SIGNALS['hold']
+
+    def getAllSignals(self):
+        """
+        Calculates the trading signals for all the periods of the calculated
+        technical indicator, in a single pass. Equivalent to calling the
+        ``getTiSignal`` method for each period, with the data up to it.
+
+        Returns:
+            numpy.ndarray: The trading signal value of each period, one of
+            {0 (hold), -1 (buy), 1 (sell)}.
+        """
+
+        return _rsiSignals(self._ti_data['rsi'].to_numpy())
@@ -6,6 +6,7 @@ File name: _technical_indicator.py
 """
 
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from abc import ABC, abstractmethod
 
@@ -17,6 +18,7 @@ from utils.data_validation import validateInputData
 from utils.exceptions import WrongTypeForInputParameter, \
     TtiPackageDeprecatedMethod
 from utils.trading_simulation import TradingSimulation
+from utils.constants import TRADE_SIGNALS
 
 
 class TechnicalIndicator(ABC):
@@ -41,6 +43,14 @@ class TechnicalIndicator(ABC):
 
         _input_data (pandas.DataFrame): The input data after preprocessing.
 
+        _input_dtype (numpy.dtype): Class attribute, the type of the
+            ``_input_arrays``. Defaults to float64, it can be set to float32 by
+            a subclass (or on the class) to halve the memory read by the
+            calculations, with a loss of precision.
+
+        _input_arrays (dict): The input data columns as contiguous
+            ``numpy.ndarray`` of type ``_input_dtype``, for the calculations.
+
         _ti_data (pandas.DataFrame): Technical Indicator calculated data.
 
     Raises:
@@ -48,6 +58,8 @@ class TechnicalIndicator(ABC):
         NotEnoughInputData: Not enough data for calculating the indicator.
     """
 
+    _input_dtype = np.float64
+
     def __init__(self, calling_instance, input_data, fill_missing_values=True):
 
         # Validate fill missing values input parameter
@@ -57,8 +69,12 @@ class TechnicalIndicator(ABC):
 
         self._calling_instance = calling_instance
 
-        # Read the properties for the specific Technical Indicator
-        self._properties = INDICATORS_PROPERTIES[calling_instance]
+        # Read the properties for the specific Technical Indicator. A subclass
+        # (for example setting the _input_dtype) uses the properties of the
+        # indicator it extends.
+        self._properties = next(
+            INDICATORS_PROPERTIES[cls.__name__] for cls in type(self).__mro__
+            if cls.__name__ in INDICATORS_PROPERTIES)
 
         # Input data preprocessing
         self._input_data = \
@@ -67,8 +83,14 @@ class TechnicalIndicator(ABC):
                               calling_instance,
                               fill_missing_values=fill_missing_values)
 
+        # One time conversion of the input data to contiguous arrays (one
+        # row per column), so calculations do not index the DataFrame
+        input_values = np.ascontiguousarray(
+            self._input_data.to_numpy(dtype=self._input_dtype).T)
+        self._input_arrays = dict(zip(self._input_data.columns, input_values))
+
         # Calculation of the Technical Indicator
-        self._ti_data = self._calculateTi()
+        self._ti_data = self._calculateTi(period=self._period)
 
     @staticmethod
     def _rolling_pipe(df, window, function):
@@ -366,25 +388,36 @@ class TechnicalIndicator(ABC):
             max_exposure=max_exposure,
             short_exposure_factor=short_exposure_factor)
 
-        # keep safe the full input and indicator data
-        full_ti_data = self._ti_data
-        full_input_data = self._input_data
+        # Indicators implementing the getAllSignals method calculate the
+        # signals of all the simulation rounds at once
+        if hasattr(self, 'getAllSignals'):
+            trade_signals = {signal[1]: signal
+                             for signal in TRADE_SIGNALS.values()}
+
+            for i, signal in enumerate(self.getAllSignals()):
+                simulator.runSimulationRound(i_index=i,
+                                             signal=trade_signals[signal])
 
-        # Run simulation rounds for the whole period
-        for i in range(len(self._ti_data.index)):
+        else:
+            # keep safe the full input and indicator data
+            full_ti_data = self._ti_data
+            full_input_data = self._input_data
 
-            # Limit the input and indicator data to this simulation round
-            self._input_data = full_input_data[
-                full_input_data.index <= full_input_data.index[i]]
+            # Run simulation rounds for the whole period
+            for i in range(len(self._ti_data.index)):
 
-            self._ti_data = full_ti_data[
-                full_ti_data.index <= full_ti_data.index[i]]
+                # Limit the input and indicator data to this simulation
+                # round. The data are sorted on the index, so they are
+                # limited by position.
+                self._input_data = full_input_data.iloc[:i + 1]
+                self._ti_data = full_ti_data.iloc[:i + 1]
 
-            simulator.runSimulationRound(i_index=i, signal=self.getTiSignal())
+                simulator.runSimulationRound(i_index=i,
+                                             signal=self.getTiSignal())
 
-        # Restore input and indicator data to full range
-        self._ti_data = full_ti_data
-        self._input_data = full_input_data
+            # Restore input and indicator data to full range
+            self._ti_data = full_ti_data
+            self._input_data = full_input_data
 
         simulation_data, statistics = simulator.closeSimulation()
 
@@ -6,12 +6,96 @@ File name: _triple_exponential_moving_average.py
 """
 
 import pandas as pd
+import numpy as np
 import os, sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from _technical_indicator_MM3 import TechnicalIndicator
 from utils.constants import TRADE_SIGNALS
 from utils.exceptions import NotEnoughInputData, WrongTypeForInputParameter,\
     WrongValueForInputParameter
+from utils.jit import njit, NUMBA_AVAILABLE
+from utils.moving_average import exponentialMovingAverage
+
+
+@njit(nogil=True, cache=True)
+def _temaKernel(close, period):
+    """
+    Calculates the Triple Exponential Moving Average in a single pass, by
+    carrying the three chained exponential moving averages as running values.
+    Each moving average is calculated as the pandas ``ewm(span=period,
+    min_periods=period, adjust=False)`` of the previous one.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int): The span of the exponential moving averages.
+
+    Returns:
+        numpy.ndarray: The Triple Exponential Moving Average. The first
+        ``3 * (period - 1)`` values are NaN.
+    """
+
+    alpha = 2.0 / (period + 1)
+    tema = np.full(close.shape[0], np.nan)
+
+    ema = close[0]
+    double_ema = 0.0
+    triple_ema = 0.0
+
+    for i in range(close.shape[0]):
+        ema += alpha * (close[i] - ema)
+
+        # Each moving average starts from the first valid value of the
+        # previous one
+        if i == period - 1:
+            double_ema = ema
+        elif i > period - 1:
+            double_ema += alpha * (ema - double_ema)
+
+        if i == 2 * (period - 1):
+            triple_ema = double_ema
+        elif i > 2 * (period - 1):
+            triple_ema += alpha * (double_ema - triple_ema)
+
+        if i >= 3 * (period - 1):
+            tema[i] = 3.0 * ema - 3.0 * double_ema + triple_ema
+
+    return tema
+
+
+def _temaFilter(close, period):
+    """
+    Equivalent of the ``_temaKernel``, used when numba is not available. The
+    three exponential moving averages are calculated with ``lfilter``.
+
+    Args:
+        close (numpy.ndarray): The close prices.
+
+        period (int): The span of the exponential moving averages.
+
+    Returns:
+        numpy.ndarray: The Triple Exponential Moving Average. The first
+        ``3 * (period - 1)`` values are NaN.
+    """
+
+    # Each moving average starts from the first valid value of the previous
+    # one
+    ema = exponentialMovingAverage(close, period)
+
+    double_ema = np.full(close.shape[0], np.nan)
+    double_ema[period - 1:] = exponentialMovingAverage(
+        ema[period - 1:], period)
+
+    triple_ema = np.full(close.shape[0], np.nan)
+    triple_ema[2 * (period - 1):] = exponentialMovingAverage(
+        double_ema[2 * (period - 1):], period)
+
+    # Combined in the buffer of the first moving average
+    tema = np.subtract(ema, double_ema, out=ema)
+    tema *= 3.0
+    tema += triple_ema
+
+    return tema
 
 
 class TripleExponentialMovingAverage(TechnicalIndicator):
@@ -22,9 +106,15 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
         input_data (pandas.DataFrame): The input data. Required input column
             is ``close``. The index is of type ``pandas.DatetimeIndex``.
 
-        period (int, default=5): The past periods to be used for the
+        period (int, default=100): The past periods to be used for the
             calculation of the indicator.
 
+        engine ({None, 'numba', 'scipy'}, default=None): The calculation
+            engine. ``numba`` runs the single pass compiled kernel, the first
+            call of a process includes its compilation time. ``scipy`` chains
+            three ``lfilter`` exponential moving averages. If None, ``numba``
+            is used when installed, else ``scipy``.
+
         fill_missing_values (bool, default=True): If set to True, missing
             values in the input data are being filled.
 
@@ -45,18 +135,47 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
         TypeError: Type error occurred when validating the ``input_data``.
         ValueError: Value error occurred when validating the ``input_data``.
     """
-    def __init__(self, input_data,fill_missing_values=True):
-   
+    def __init__(self, input_data, period=100, engine=None,
+                 fill_missing_values=True):
+
+        # Validate and store if needed, the input parameters
+        if isinstance(period, int):
+            if period > 0:
+                self._period = period
+            else:
+                raise WrongValueForInputParameter(
+                    period, 'period', '>0')
+        else:
+            raise WrongTypeForInputParameter(
+                type(period), 'period', 'int')
+
+        if engine is None:
+            self._engine = 'numba' if NUMBA_AVAILABLE else 'scipy'
+
+        elif engine not in ['numba', 'scipy'] or (
+                engine == 'numba' and not NUMBA_AVAILABLE):
+            raise WrongValueForInputParameter(
+                engine, 'engine',
+                "None, 'numba', 'scipy'" if NUMBA_AVAILABLE else
+                "None, 'scipy' (numba is not installed)")
+
+        else:
+            self._engine = engine
+
         # Control is passing to the parent class
         super().__init__(calling_instance=self.__class__.__name__,
                          input_data=input_data,
                          fill_missing_values=fill_missing_values)
 
-    def _calculateTi(self,period):
+    def _calculateTi(self, period):
         """
         Calculates the technical indicator for the given input data. The input
         data are taken from an attribute of the parent class.
 
+        Args:
+            period (int): The past periods to be used for the calculation of
+                the indicator.
+
         Returns:
             pandas.DataFrame: The calculated indicator. Index is of type
             ``pandas.DatetimeIndex``. It contains one column, the ``tema``.
@@ -66,31 +185,19 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
         """
 
         # Not enough data for the requested period
-        if len(self._input_data.index) < self._period:
+        if len(self._input_data.index) < period:
             raise NotEnoughInputData('Triple Exponential Moving Average',
-                                     self._period, len(self._input_data.index))
-
-        tema = pd.DataFrame(index=self._input_data.index, columns=['tema'],
-                            data=0, dtype='float64')
-
-        # Exponential moving average of prices
-        ema = self._input_data.ewm(
-            span=period, min_periods=period, adjust=False, axis=0
-        ).mean()
+                                     period, len(self._input_data.index))
 
-        # Double Exponential moving average of prices
-        double_ema = ema.ewm(
-            span=period, min_periods=period, adjust=False,
-            axis=0).mean()
+        close = self._input_arrays['close']
 
-        # Triple Exponential moving average of prices
-        triple_ema = double_ema.ewm(
-            span=period, min_periods=period, adjust=False,
-            axis=0).mean()
+        if self._engine == 'numba':
+            tema = _temaKernel(close, period)
+        else:
+            tema = _temaFilter(close, period)
 
-        tema['tema'] = (3 * ema) - (3 * double_ema) + triple_ema
-
-        return tema
+        return pd.DataFrame(index=self._input_data.index, columns=['tema'],
+                            data=tema)
 
     def getTiSignal(self):
         """
@@ -106,12 +213,37 @@ class TripleExponentialMovingAverage(TechnicalIndicator):
         if len(self._ti_data.index) < 1:
             return TRADE_SIGNALS['hold']
 
+        close = self._input_data['close'].to_numpy()[-1]
+        tema = self._ti_data['tema'].to_numpy()[-1]
+
         # Close price is below Moving Average
-        if self._input_data['close'].iat[-1] < self._ti_data['tema'].iat[-1]:
+        if close < tema:
             return TRADE_SIGNALS['buy']
 
         # Close price is above Moving Average
-        if self._input_data['close'].iat[-1] > self._ti_data['tema'].iat[-1]:
+        if close > tema:
             return TRADE_SIGNALS['sell']
 
         return TRADE_SIGNALS['hold']
+
+    def getAllSignals(self):
+        """
+        Calculates the trading signals for all the periods of the calculated
+        technical indicator, vectorized. Equivalent to calling the
+        ``getTiSignal`` method for each period, with the data up to it.
+
+        Returns:
+            numpy.ndarray: The trading signal value of each period, one of
+            {0 (hold), -1 (buy), 1 (sell)}.
+        """
+
+        close = self._input_arrays['close']
+        tema = self._ti_data['tema'].to_numpy()
+
+        # Close price below (buy) or above (sell) the Moving Average, hold
+        # while the Moving Average is not defined
+        signals = np.zeros(tema.shape[0], dtype=np.int8)
+        signals[close < tema] = TRADE_SIGNALS['buy'][1]
+        signals[close > tema] = TRADE_SIGNALS['sell'][1]
+
+        return signals
@@ -6,6 +6,7 @@ File name: _volume_rate_of_change.py
 """
 
 import pandas as pd
+import numpy as np
 import os, sys
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 from _technical_indicator_roc import TechnicalIndicator
@@ -22,7 +23,7 @@ class VolumeRateOfChange(TechnicalIndicator):
         input_data (pandas.DataFrame): The input data. Required input column
             is ``volume``. The index is of type ``pandas.DatetimeIndex``.
 
-        period (int, default=5): The past periods to be used for the
+        period (int, default=100): The past periods to be used for the
             calculation of the indicator.
 
         fill_missing_values (bool, default=True): If set to True, missing
@@ -45,8 +46,8 @@ class VolumeRateOfChange(TechnicalIndicator):
         TypeError: Type error occurred when validating the ``input_data``.
         ValueError: Value error occurred when validating the ``input_data``.
     """
-    def __init__(self, input_data,fill_missing_values=True):
-        """
+    def __init__(self, input_data, period=100, fill_missing_values=True):
+
         # Validate and store if needed, the input parameters
         if isinstance(period, int):
             if period > 0:
@@ -57,7 +58,7 @@ class VolumeRateOfChange(TechnicalIndicator):
         else:
             raise WrongTypeForInputParameter(
                 type(period), 'period', 'int')
-        """
+
         # Control is passing to the parent class
         super().__init__(calling_instance=self.__class__.__name__,
                          input_data=input_data,
@@ -81,15 +82,20 @@ class VolumeRateOfChange(TechnicalIndicator):
             raise NotEnoughInputData('Volume Rate of Change', period,
                                      len(self._input_data.index))
 
-        vrc = pd.DataFrame(index=self._input_data.index, columns=['vrc'],
-                           data=None, dtype='float64')
+        volume = self._input_arrays['volume']
+
+        # Volume of the period ago, shifted once
+        previous_volume = np.full(volume.shape[0], np.nan)
+        previous_volume[period:] = volume[:volume.shape[0] - period]
 
-        vrc['vrc'] = 100 * ((
-                self._input_data['volume'] -
-                self._input_data['volume'].shift(period)
-                            ) / self._input_data['volume'].shift(period))
+        # Rate of change is not defined when the volume of the period ago is
+        # zero
+        vrc = np.full(volume.shape[0], np.nan)
+        np.divide(100.0 * (volume - previous_volume), previous_volume,
+                  out=vrc, where=previous_volume != 0.0)
 
-        return vrc
+        return pd.DataFrame(index=self._input_data.index, columns=['vrc'],
+                            data=vrc)
 
     def getTiSignal(self):
         """
@@ -108,15 +114,39 @@ class VolumeRateOfChange(TechnicalIndicator):
         if len(self._ti_data.index) < 3:
             return TRADE_SIGNALS['hold']
 
+        vrc = self._ti_data['vrc'].to_numpy()[-3:]
+
         # Warning for a downward breakout
-        if self._ti_data['vrc'].iat[-3] > self._ti_data['vrc'].iat[-2] > \
-                self._ti_data['vrc'].iat[-1]:
+        if vrc[0] > vrc[1] > vrc[2]:
             return TRADE_SIGNALS['buy']
 
         # Warning for a upward breakout
-        elif self._ti_data['vrc'].iat[-3] < self._ti_data['vrc'].iat[-2] < \
-                self._ti_data['vrc'].iat[-1]:
+        elif vrc[0] < vrc[1] < vrc[2]:
             return TRADE_SIGNALS['sell']
 
         else:
             return TRADE_SIGNALS['hold']
+
+    def getAllSignals(self):
+        """
+        Calculates the trading signals for all the periods of the calculated
+        technical indicator, vectorized. Equivalent to calling the
+        ``getTiSignal`` method for each period, with the data up to it.
+
+        Returns:
+            numpy.ndarray: The trading signal value of each period, one of
+            {0 (hold), -1 (buy), 1 (sell)}.
+        """
+
+        vrc = self._ti_data['vrc'].to_numpy()
+        signals = np.zeros(vrc.shape[0], dtype=np.int8)
+
+        # Warning for a downward breakout
+        signals[2:][(vrc[:-2] > vrc[1:-1]) & (vrc[1:-1] > vrc[2:])] = \
+            TRADE_SIGNALS['buy'][1]
+
+        # Warning for a upward breakout
+        signals[2:][(vrc[:-2] < vrc[1:-1]) & (vrc[1:-1] < vrc[2:])] = \
+            TRADE_SIGNALS['sell'][1]
+
+        return signals
@@ -6,10 +6,94 @@ File name: _parabolic_sar.py
 """
 
 import pandas as pd
+import numpy as np
 
 from ._technical_indicator import TechnicalIndicator
 from ..utils.constants import TRADE_SIGNALS
 from ..utils.exceptions import NotEnoughInputData
+from ..utils.jit import njit
+
+
+@njit(cache=True)
+def _parabolicSarKernel(high, low, af_increase, af_max):
+    """
+    Calculates the Parabolic SAR for the whole input period in a single pass.
+
+    Args:
+        high (numpy.ndarray): The high prices.
+
+        low (numpy.ndarray): The low prices.
+
+        af_increase (float): The acceleration factor increase step, also used
+            as the initial acceleration factor of each position.
+
+        af_max (float): The maximum acceleration factor.
+
+    Returns:
+        numpy.ndarray: The SAR values.
+    """
+
+    sar = np.empty(high.shape[0])
+
+    # Guess the initial position by checking the high values direction for
+    # the first two periods
+    long_position = high[1] > high[0]
+    af = af_increase
+
+    if long_position:
+        ep = high[0]
+        sar[0] = low[0]
+    else:
+        ep = low[0]
+        sar[0] = high[0]
+
+    for i in range(1, high.shape[0]):
+
+        # Extreme Price, highest price reached when in `LONG` position, or
+        # lowest price reached when in `SHORT` position (kept as a running
+        # extreme since the position start)
+        if long_position:
+            current_ep = max(ep, high[i])
+        else:
+            current_ep = min(ep, low[i])
+
+        # SAR, when `LONG` not above the two prior lows, when `SHORT` not
+        # below the two prior highs
+        current_sar = sar[i - 1] + af * (ep - sar[i - 1])
+
+        if long_position:
+            current_sar = min(current_sar, low[i - 1])
+            if i > 1:
+                current_sar = min(current_sar, low[i - 2])
+        else:
+            current_sar = max(current_sar, high[i - 1])
+            if i > 1:
+                current_sar = max(current_sar, high[i - 2])
+
+        # Position changes, re-initialize the values. The new SAR is the
+        # extreme price reached during the previous position
+        if (long_position and low[i] < current_sar) or \
+                (not long_position and high[i] > current_sar):
+
+            if long_position:
+                current_ep = low[i]
+            else:
+                current_ep = high[i]
+
+            current_sar = ep
+            long_position = not long_position
+            af = af_increase
+
+        # Acceleration Factor, increases when a new high is reached in `LONG`
+        # or a new low is reached in `SHORT`
+        elif (long_position and current_ep > ep) or \
+                (not long_position and current_ep < ep):
+            af = min(af_max, af + af_increase)
+
+        ep = current_ep
+        sar[i] = current_sar
+
+    return sar
 
 
 class ParabolicSAR(TechnicalIndicator):
@@ -72,145 +156,13 @@ class ParabolicSAR(TechnicalIndicator):
             raise NotEnoughInputData('Parabolic SAR', 2,
                                      len(self._input_data.index))
 
-        sar = pd.DataFrame(index=self._input_data.index,
-                           columns=['af', 'ep', 'sar', 'position'],
-                           data=None)
-
-        position_start_index = 0
-
-        for i in range(len(self._input_data.index)):
-
-            sar.values[i, :], position_start_index = self._calculateSarRow(
-                current_index=i, position_start_index=position_start_index,
-                previous_sar=sar.values[i-1, :], position_changed=False)
-
-        return sar[['sar']].astype(dtype='float64').round(4)
-
-    def _calculateSarRow(self, current_index, position_start_index,
-                         previous_sar=None, position_changed=False):
-        """
-        Calculate SAR in case we are in a `LONG` position.
-
-        Args:
-            current_index (int): The current dataframe index for which the SAR
-                calculation is requested.
-
-            position_start_index (int): The dataframe index (starting from 0)
-                in which the current position was started.
-
-            previous_sar (numpy.ndarray, default is None): The SAR row for the
-                previous period. Is not required when this is the first period
-                of the input data (current_index = 0).
+        sar = _parabolicSarKernel(
+            self._input_arrays['high'],
+            self._input_arrays['low'],
+            self._af_increase, self._af_max)
 
-            position_changed (boolean, default is False): Indicates if this is
-                the first calculation for a new position. Is not required when
-                this is the first period of the input data (current_index = 0).
-
-        Returns:
-            list (af, ep, sar, position):
-                - af (float): Acceleration factor for the current index.
-                - ep (float): Extreme price for the current index.
-                - sar (float): SAR indicator value for the current index.
-                - position (str, one of `LONG`, `SHORT`): The position for
-                    the current index.
-
-            int: Current position start index.
-        """
-
-        # In case this is for the first period of the input data, calculation
-        # is based on an initial position assumption (guess the initial
-        #  position by checking the high values direction for the first two
-        #  days)
-        if current_index == 0:
-
-            af = self._af_increase
-
-            if self._input_data['high'].values[1] > \
-                    self._input_data['high'].values[0]:
-                position = 'LONG'
-                ep = self._input_data['high'].values[0]
-                sar = self._input_data['low'].values[0]
-            else:
-                position = 'SHORT'
-                ep = self._input_data['low'].values[0]
-                sar = self._input_data['high'].values[0]
-
-            return [af, ep, sar, position], current_index
-
-        # Check if position changed, so to re-initialize the values
-        if position_changed:
-            af = self._af_increase
-
-            if previous_sar[3] == 'LONG':
-                position = 'SHORT'
-                ep = self._input_data['low'].values[current_index]
-                sar = self._input_data['high'].values[
-                      position_start_index:current_index].max()
-
-            else:
-                position = 'LONG'
-                ep = self._input_data['high'].values[current_index]
-                sar = self._input_data['low'].values[
-                      position_start_index:current_index].min()
-
-            return [af, ep, sar, position], current_index
-
-        # Calculate Extreme Price, Highest price reached when in current
-        # `LONG` position, or Lowest price reached when in current `SHORT`
-        # position
-        if previous_sar[3] == 'LONG':
-
-            ep = self._input_data['high'].values[
-                 position_start_index:current_index+1].max()
-
-        else:
-
-            ep = self._input_data['low'].values[
-                 position_start_index:current_index+1].min()
-
-        # Calculate Acceleration Factor, new high is reached when in `LONG` or
-        # new low is reached when in `SHORT`
-        if previous_sar[3] == 'LONG' and ep > previous_sar[1]:
-
-            af = min(self._af_max,
-                     previous_sar[0] + self._af_increase)
-
-        elif previous_sar[3] == 'SHORT' and ep < previous_sar[1]:
-
-            af = min(self._af_max,
-                     previous_sar[0] + self._af_increase)
-
-        else:
-            af = previous_sar[0]
-
-        # Calculate SAR, when `LONG` not above the two prior lows, when `SHORT`
-        # not below the two prior highs
-        sar = previous_sar[2] + previous_sar[0] * (
-                previous_sar[1] - previous_sar[2])
-
-        if previous_sar[3] == 'LONG':
-            sar = min(sar, self._input_data['low'].values[
-                           max(0, current_index-2):current_index].min())
-
-        else:
-            sar = max(sar, self._input_data['high'].values[
-                           max(0, current_index - 2):current_index].max())
-
-        # Check if position changes
-        if (previous_sar[3] == 'SHORT' and
-            self._input_data['high'].values[current_index] > sar) or \
-                (previous_sar[3] == 'LONG' and
-                 self._input_data['low'].values[current_index] < sar):
-
-            return self._calculateSarRow(
-                current_index=current_index,
-                position_start_index=position_start_index,
-                previous_sar=previous_sar, position_changed=True)
-
-        else:
-            position = previous_sar[3]
-
-        return [af, ep, sar, position], position_start_index
+        return pd.DataFrame(index=self._input_data.index, columns=['sar'],
+                            data=sar, dtype='float64').round(4)
 
     def getTiSignal(self):
         """
@@ -226,16 +178,14 @@ class ParabolicSAR(TechnicalIndicator):
         if len(self._ti_data.index) < 2:
             return TRADE_SIGNALS['hold']
 
-        if ((self._input_data['close'].iat[-2] >
-                self._ti_data['sar'].iat[-2]) and
-                (self._input_data['close'].iat[-1] <
-                 self._ti_data['sar'].iat[-1])):
+        # Last two periods close and sar values
+        close = self._input_data['close'].to_numpy()[-2:]
+        sar = self._ti_data['sar'].to_numpy()[-2:]
+
+        if close[0] > sar[0] and close[1] < sar[1]:
             return TRADE_SIGNALS['buy']
 
-        elif ((self._input_data['close'].iat[-2] <
-               self._ti_data['sar'].iat[-2]) and
-              (self._input_data['close'].iat[-1] >
-               self._ti_data['sar'].iat[-1])):
+        elif close[0] < sar[0] and close[1] > sar[1]:
             return TRADE_SIGNALS['sell']
 
         else:
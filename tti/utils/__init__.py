@@ -5,5 +5,6 @@ the `tti.utils` package includes the implementation of library utilities.
 """
 
 from .data_preprocessing import fillMissingValues
+from .data_conversion import fromPolars, toPolars
 
-__all__ = ['fillMissingValues']
+__all__ = ['fillMissingValues', 'fromPolars', 'toPolars']
@@ -0,0 +1,106 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: data_conversion.py
+    Conversions between polars and pandas data, defined under the tti.utils
+    package. The polars package is optional and imported only when these
+    methods are called.
+"""
+
+import pandas as pd
+
+
+def _importPolars():
+    """
+    Imports the optional polars package.
+
+    Returns:
+        module: The polars package.
+
+    Raises:
+        ImportError: The polars package is not installed.
+    """
+
+    try:
+        import polars
+
+    except ImportError:
+        raise ImportError('The polars package is required for this ' +
+                          'conversion, install it with `pip install ' +
+                          'tti[polars]`.') from None
+
+    return polars
+
+
+def fromPolars(input_data, date_column='date'):
+    """
+    Converts a polars DataFrame to the pandas DataFrame expected as indicators
+    input data. The columns are moved through numpy arrays.
+
+    Args:
+        input_data (polars.DataFrame): The input data.
+
+        date_column (str, default='date'): The column holding the dates, it
+            becomes the ``pandas.DatetimeIndex`` of the returned DataFrame.
+
+    Returns:
+        pandas.DataFrame: The input data. The index is of type
+        ``pandas.DatetimeIndex``.
+
+    Raises:
+        ImportError: The polars package is not installed.
+        TypeError: Type error occurred when validating the ``input_data``.
+        ValueError: The ``date_column`` is not contained in the input data.
+    """
+
+    pl = _importPolars()
+
+    if not isinstance(input_data, pl.DataFrame):
+        raise TypeError('Invalid input_data type. It was expected ' +
+                        '`polars.DataFrame` but `' +
+                        str(type(input_data).__name__) + '` was found.')
+
+    if date_column not in input_data.columns:
+        raise ValueError('Date column `' + date_column + '` is not ' +
+                         'contained in the input data.')
+
+    return pd.DataFrame(
+        index=pd.DatetimeIndex(input_data[date_column].to_numpy(),
+                               name=date_column),
+        data={column: input_data[column].to_numpy()
+              for column in input_data.columns if column != date_column})
+
+
+def toPolars(ti_data, date_column='date'):
+    """
+    Converts the calculated indicator data to a polars DataFrame.
+
+    Args:
+        ti_data (pandas.DataFrame): The calculated indicator data, as returned
+            by the ``getTiData`` method. Index is of type
+            ``pandas.DatetimeIndex``.
+
+        date_column (str, default='date'): The name of the column holding the
+            index dates in the returned DataFrame.
+
+    Returns:
+        polars.DataFrame: The calculated indicator data, with the dates as the
+        first column.
+
+    Raises:
+        ImportError: The polars package is not installed.
+        TypeError: Type error occurred when validating the ``ti_data``.
+    """
+
+    pl = _importPolars()
+
+    if not isinstance(ti_data, pd.DataFrame):
+        raise TypeError('Invalid ti_data type. It was expected ' +
+                        '`pd.DataFrame` but `' +
+                        str(type(ti_data).__name__) + '` was found.')
+
+    data = {date_column: ti_data.index.to_numpy()}
+    data.update({column: ti_data[column].to_numpy()
+                 for column in ti_data.columns})
+
+    return pl.DataFrame(data)
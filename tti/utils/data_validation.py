@@ -62,8 +62,8 @@ def validateInputData(input_data, required_columns, indicator_name,
     if input_data.empty:
         raise ValueError('The input_data cannot be an empty pandas.DataFrame.')
 
-    # Make columns case insensitive
-    input_data.columns = [c.lower() for c in input_data.columns]
+    # Make columns case insensitive, without modifying the caller's data frame
+    input_data = input_data.rename(columns=str.lower)
 
     # Validate that the data frame holds columns of numeric type and that all
     # the required columns are contained.
@@ -80,15 +80,16 @@ def validateInputData(input_data, required_columns, indicator_name,
                              column + '` is of type `' +
                              str(input_data[column].dtype) + '`.')
 
-    # Remove not required columns, if any
-    for column in input_data.columns:
-        if column not in required_columns:
-            input_data = input_data.drop(columns=column, inplace=False)
+    # Keep only the required columns (in the input order) with one selection,
+    # so that sorting and filling do not touch columns never read
+    input_data = input_data.loc[:, [c for c in input_data.columns
+                                    if c in required_columns]]
 
     # Sort dataframe on index ascending
     input_data = input_data.sort_index(ascending=True, inplace=False)
 
-    if fill_missing_values:
+    # Filling passes over all the columns, skipped when nothing is missing
+    if fill_missing_values and input_data.isna().to_numpy().any():
         input_data = fillMissingValues(input_data)
 
     return input_data
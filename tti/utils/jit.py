@@ -0,0 +1,37 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: jit.py
+    Optional just-in-time compilation support, defined under the tti.utils
+    package. When numba is not installed the decorators below leave the
+    decorated functions untouched, so they are executed as plain python.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+
+except ImportError:
+
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        No-op replacement of the ``numba.njit`` decorator. Supports both the
+        ``@njit`` and the ``@njit(...)`` forms.
+
+        Returns:
+            function: The decorated function, unchanged.
+        """
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(function):
+            return function
+
+        return decorator
+
+    # Without numba parallel loops are executed serially
+    prange = range
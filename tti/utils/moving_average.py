@@ -0,0 +1,42 @@
+"""
+Trading-Technical-Indicators (tti) python library
+
+File name: moving_average.py
+    Moving average calculations defined under the tti.utils package.
+"""
+
+import numpy as np
+from scipy.signal import lfilter
+
+
+def exponentialMovingAverage(values, span):
+    """
+    Calculates the exponential moving average of the given values, as the
+    pandas ``ewm(span=span, min_periods=span, adjust=False)`` one. The
+    recurrence ``ema = ema + alpha * (value - ema)`` is executed as a first
+    order filter, with ``alpha = 2 / (span + 1)`` and the state seeded with the
+    first value.
+
+    Args:
+        values (numpy.ndarray): The input values, without missing values.
+
+        span (int): The span of the exponential moving average.
+
+    Returns:
+        numpy.ndarray: The exponential moving average. The first ``span - 1``
+        values are NaN.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if values.shape[0] == 0:
+        return np.empty(0)
+
+    alpha = 2.0 / (span + 1)
+
+    ema, _ = lfilter([alpha], [1.0, alpha - 1.0], values,
+                     zi=[(1.0 - alpha) * values[0]])
+
+    ema[:span - 1] = np.nan
+
+    return ema
@@ -8,10 +8,8 @@ File name: trading_simulation.py
 
 import pandas as pd
 import numpy as np
-import os, sys
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-from utils.data_validation import validateInputData
-from utils.exceptions import WrongTypeForInputParameter, \
+from .data_validation import validateInputData
+from .exceptions import WrongTypeForInputParameter, \
     NotValidInputDataForSimulation, WrongValueForInputParameter
 
 